@@ -19,6 +19,9 @@ sys.path.insert(0, 'src')
 from gossip import GossipFingerprint
 from gossip.utils import graph_to_adjacency_list, are_isomorphic, generate_circulant_graph
 
+# The algorithm object holds no per-graph state, so one instance serves every pair
+GF = GossipFingerprint()
+
 
 def test_circulant_pair(n: int, jumps1: List[int], jumps2: List[int]) -> Dict[str, Any]:
     """
@@ -45,8 +48,7 @@ def test_circulant_pair(n: int, jumps1: List[int], jumps2: List[int]) -> Dict[st
     actual_iso = are_isomorphic(G1, G2)
 
     # Check gossip algorithm result
-    gf = GossipFingerprint()
-    gossip_iso = gf.compare(G1, G2)
+    gossip_iso = GF.compare(G1, G2)
 
     # Determine result type
     correct = (actual_iso == gossip_iso)
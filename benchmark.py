@@ -13,7 +13,9 @@ from __future__ import annotations
 
 import sys
 import argparse
+import functools
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional, Sequence, Tuple
 
 # Ensure local imports work without installation
@@ -86,6 +88,7 @@ def build_basic_cases() -> List[Case]:
 
 def build_symmetry_cases() -> List[Case]:
     cases: List[Case] = []
+    built = {}
     for gen_name, disp in [
         ("petersen_graph", "Petersen"),
         ("dodecahedral_graph", "Dodecahedral"),
@@ -99,10 +102,10 @@ def build_symmetry_cases() -> List[Case]:
         ("cubical_graph", "Cubical"),
     ]:
         if hasattr(nx, gen_name):
-            G = getattr(nx, gen_name)()
+            G = built[gen_name] = getattr(nx, gen_name)()
             cases.append(Case("symmetry", f"{disp} — relabel", G, relabel_graph(G, seed=7), True))
-    if hasattr(nx, "petersen_graph"):
-        G = nx.petersen_graph()
+    if "petersen_graph" in built:
+        G = built["petersen_graph"]
         cases.append(Case("symmetry", "Petersen vs Complement", G, nx.complement(G), False))
     return cases
 
@@ -173,7 +176,9 @@ def print_usage(groups: List[str]) -> None:
     print("  --filter SUBSTR             Filter cases by substring in case name")
     print("  --complexity {n,m}          Fit observed scaling per group")
     print("  --nx-timeout-ms MS          Per-case NetworkX timeout (0 to disable)")
-    print("  --nx-timeout-threshold K    If n*m <= K, run NX inline (no process)\n")
+    print("  --nx-timeout-threshold K    If n*m <= K, run NX inline (no process)")
+    print("  --jobs N                    Run groups in N worker processes (noisier timings)")
+    print("  --trust-expected            Skip NetworkX on cases with a known answer\n")
     print("Examples:")
     print("  ./benchmark.py                       # show this help")
     print("  ./benchmark.py circulant             # run circulant group")
@@ -185,7 +190,7 @@ def print_usage(groups: List[str]) -> None:
 def main(argv: Optional[Sequence[str]] = None) -> int:
     # If no args provided, show help and exit
     if argv is None and len(sys.argv) == 1:
-        groups = [
+        group_names = [
             "basic",
             "symmetry",
             "families",
@@ -205,7 +210,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             "cages",
             "all",
         ]
-        print_usage(groups)
+        print_usage(group_names)
         return 0
 
     parser = argparse.ArgumentParser(description="Gossip isomorphism benchmarks (modular groups)")
@@ -238,6 +243,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     parser.add_argument("--complexity", choices=["n", "m"], default=None, help="Report observed scaling vs n or m per group")
     parser.add_argument("--nx-timeout-ms", type=int, default=3000, help="Timeout in ms for NetworkX isomorphism per case (0 to disable)")
     parser.add_argument("--nx-timeout-threshold", type=int, default=3000, help="If n*m <= threshold, run NX inline to avoid process overhead")
+    parser.add_argument("--jobs", type=int, default=1, help="Run groups in this many worker processes (timings get noisier when > 1)")
+    parser.add_argument("--trust-expected", action="store_true", help="Use each case's expected answer instead of running NetworkX when one is given")
 
     args = parser.parse_args(argv)
 
@@ -249,18 +256,33 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     print("============================================================")
     print(" Comparing Gossip vs NetworkX per test (times in ms).\n")
 
-    for group_name, cases in groups:
-        if args.filter:
-            cases = [c for c in cases if args.filter.lower() in c.name.lower()]
-        if not cases:
-            continue
-        group_results = run_cases(cases, nx_timeout_ms=args.nx_timeout_ms, nx_timeout_threshold=args.nx_timeout_threshold)
-        print_group_table(group_name, group_results)
-        correct, total, avg_tg, avg_tn, avg_sp = summarize(group_results)
-        print(f" -> Summary: {correct}/{total} correct | avg gossip {avg_tg:.2f}ms | avg nx {avg_tn:.2f}ms | avg speedup x{avg_sp:.1f}")
-        if args.complexity:
-            report_complexity(group_results, size=args.complexity)
-        all_results.extend(group_results)
+    if args.filter:
+        groups = [(name, [c for c in cases if args.filter.lower() in c.name.lower()]) for name, cases in groups]
+    groups = [(name, cases) for name, cases in groups if cases]
+
+    # Groups are independent; with --jobs > 1 they run in worker processes and
+    # are still reported in order. The serial map is lazy, so output streams.
+    run = functools.partial(
+        run_cases,
+        nx_timeout_ms=args.nx_timeout_ms,
+        nx_timeout_threshold=args.nx_timeout_threshold,
+        trust_expected=args.trust_expected,
+    )
+    pool = ProcessPoolExecutor(max_workers=args.jobs) if args.jobs > 1 else None
+    try:
+        results_per_group = pool.map(run, [cases for _, cases in groups]) if pool else map(run, [cases for _, cases in groups])
+
+        for (group_name, _), group_results in zip(groups, results_per_group):
+            print_group_table(group_name, group_results)
+            correct, total, avg_tg, avg_tn, avg_sp = summarize(group_results)
+            print(f" -> Summary: {correct}/{total} correct | avg gossip {avg_tg:.2f}ms | avg nx {avg_tn:.2f}ms | avg speedup x{avg_sp:.1f}")
+            if args.complexity:
+                report_complexity(group_results, size=args.complexity)
+            all_results.extend(group_results)
+    finally:
+        # Also on a worker exception or Ctrl-C: drop queued groups and reap the workers
+        if pool:
+            pool.shutdown(cancel_futures=True)
 
     # Final performance report
     print("\n============================================================")
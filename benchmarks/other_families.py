@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import itertools
 import networkx as nx
+import numpy as np
 
 from gossip.utils import relabel_graph
 from .common import Case
@@ -12,12 +13,12 @@ def build_kneser(n: int, k: int) -> nx.Graph:
     if hasattr(nx, "kneser_graph"):
         return nx.kneser_graph(n, k)
     nodes = list(itertools.combinations(range(n), k))
+    masks = [_subset_mask(c) for c in nodes]
     G = nx.Graph()
     G.add_nodes_from(nodes)
-    for i in range(len(nodes)):
-        for j in range(i + 1, len(nodes)):
-            if set(nodes[i]).isdisjoint(nodes[j]):
-                G.add_edge(nodes[i], nodes[j])
+    G.add_edges_from(
+        (u, v) for (u, mu), (v, mv) in itertools.combinations(zip(nodes, masks), 2) if mu & mv == 0
+    )
     return G
 
 
@@ -25,24 +26,46 @@ def build_johnson(n: int, k: int) -> nx.Graph:
     if hasattr(nx, "johnson_graph"):
         return nx.johnson_graph(n, k)
     nodes = list(itertools.combinations(range(n), k))
+    masks = [_subset_mask(c) for c in nodes]
     G = nx.Graph()
     G.add_nodes_from(nodes)
-    for i in range(len(nodes)):
-        si = set(nodes[i])
-        for j in range(i + 1, len(nodes)):
-            sj = set(nodes[j])
-            if len(si & sj) == k - 1:
-                G.add_edge(nodes[i], nodes[j])
+    G.add_edges_from(
+        (u, v) for (u, mu), (v, mv) in itertools.combinations(zip(nodes, masks), 2) if (mu & mv).bit_count() == k - 1
+    )
+    return G
+
+
+def _subset_mask(subset: Tuple[int, ...]) -> int:
+    # Bit b is set iff b is in the subset: intersections become & and sizes bit_count()
+    return sum(1 << b for b in subset)
+
+
+def build_rook(n: int) -> nx.Graph:
+    if hasattr(nx, "rooks_graph"):
+        return nx.rooks_graph(n, n)
+    # Cells are adjacent iff they share exactly one coordinate (same row or same column);
+    # compare all cell pairs at once instead of looping over them in Python
+    cells = np.array(list(itertools.product(range(n), repeat=2)))
+    shared = (cells[:, None, :] == cells[None, :, :]).sum(axis=2)
+    ii, jj = np.nonzero(np.triu(shared == 1, k=1))
+    G = nx.Graph()
+    G.add_edges_from((tuple(cells[i].tolist()), tuple(cells[j].tolist())) for i, j in zip(ii, jj))
     return G
 
 
 def build_paley(q: int) -> Optional[nx.Graph]:
-    if hasattr(nx, "paley_graph"):
-        try:
-            return nx.paley_graph(q)
-        except Exception:
-            return None
-    return None
+    # Paley graph over the prime field Z_q: x ~ y iff x - y is a nonzero square mod q.
+    # q must be a prime with q % 4 == 1 so that -1 is a square and adjacency is symmetric.
+    if q % 4 != 1 or any(q % d == 0 for d in range(2, int(q ** 0.5) + 1)):
+        return None
+    is_square = np.zeros(q, dtype=bool)
+    is_square[[pow(x, 2, q) for x in range(1, q)]] = True
+    points = np.arange(q)
+    ii, jj = np.nonzero(np.triu(is_square[(points[:, None] - points[None, :]) % q], k=1))
+    G = nx.Graph()
+    G.add_nodes_from(range(q))
+    G.add_edges_from(zip(ii.tolist(), jj.tolist()))
+    return G
 
 
 def build_kneser_cases() -> List[Case]:
@@ -77,7 +100,7 @@ def build_johnson_cases() -> List[Case]:
 
 def build_paley_cases() -> List[Case]:
     cases: List[Case] = []
-    for q in [5, 9, 13, 17, 29]:
+    for q in [5, 13, 17, 29, 37, 41]:
         G = build_paley(q)
         if G is not None:
             cases.append(Case("paley", f"Paley P({q}) — relabel", G, relabel_graph(G, seed=q), True))
@@ -87,18 +110,7 @@ def build_paley_cases() -> List[Case]:
 def build_rook_shrikhande_cases() -> List[Case]:
     cases: List[Case] = []
     # Build 4x4 rook's graph (grid graph with rook moves)
-    if hasattr(nx, "rooks_graph"):
-        R = nx.rooks_graph(4, 4)
-    else:
-        R = nx.Graph()
-        for i in range(4):
-            for j in range(4):
-                for jj in range(4):
-                    if jj != j:
-                        R.add_edge((i, j), (i, jj))
-                for ii in range(4):
-                    if ii != i:
-                        R.add_edge((i, j), (ii, j))
+    R = build_rook(4)
     # Build Shrikhande graph (16,6,2,2)
     if hasattr(nx, "shrikhande_graph"):
         S = nx.shrikhande_graph()
@@ -127,16 +139,22 @@ def build_rook_shrikhande_cases() -> List[Case]:
 def build_gpetersen_cases() -> List[Case]:
     cases: List[Case] = []
     if hasattr(nx, "generalized_petersen_graph"):
+        # Build each GP(n,k) once; run_cases clears its cache before timing each case
+        GP = {
+            (n, k): nx.generalized_petersen_graph(n, k)
+            for n, k in [(8, 3), (10, 2), (10, 3), (12, 4), (12, 5), (14, 3), (14, 5), (15, 4)]
+        }
         for n, k in [(8, 3), (10, 2), (12, 5), (14, 3), (15, 4)]:
-            G = nx.generalized_petersen_graph(n, k)
+            G = GP[n, k]
             cases.append(Case("gpetersen", f"GP({n},{k}) — relabel", G, relabel_graph(G, seed=n*10+k), True))
         # Non-ISO pairs with same n different k
         cases.extend(
             [
-                Case("gpetersen", "GP(10,2) vs GP(10,3)", nx.generalized_petersen_graph(10, 2), nx.generalized_petersen_graph(10, 3), False),
-                Case("gpetersen", "GP(12,5) vs GP(12,4)", nx.generalized_petersen_graph(12, 5), nx.generalized_petersen_graph(12, 4), False),
-                Case("gpetersen", "GP(14,3) vs GP(14,5)", nx.generalized_petersen_graph(14, 3), nx.generalized_petersen_graph(14, 5), False),
-                Case("gpetersen", "Petersen vs Dodecahedral", nx.petersen_graph(), nx.generalized_petersen_graph(10, 2), False),
+                Case("gpetersen", "GP(10,2) vs GP(10,3)", GP[10, 2], GP[10, 3], False),
+                Case("gpetersen", "GP(12,5) vs GP(12,4)", GP[12, 5], GP[12, 4], False),
+                Case("gpetersen", "Petersen vs Dodecahedral", nx.petersen_graph(), GP[10, 2], False),
+                # GP(n,k) ≅ GP(n,l) when k*l ≡ ±1 (mod n): 3*5 = 15 ≡ 1 (mod 14)
+                Case("gpetersen", "GP(14,3) vs GP(14,5)", GP[14, 3], GP[14, 5], True),
             ]
         )
     return cases
\ No newline at end of file
@@ -18,17 +18,18 @@ def build_cases() -> List[Case]:
     # Non-invertibility: non-isomorphic graphs with isomorphic line graphs beyond Whitney pair are rare; add a sanity non-ISO pair
     cases.append(Case("transforms", "Line L(P4) vs L(C4)", L(nx.path_graph(4)), L(nx.cycle_graph(4)), False))
 
-    P6 = nx.path_graph(6)
-    cases.append(Case("transforms", "Line L(P6) — relabel", L(P6), relabel_graph(L(P6), seed=6), True))
-    C8 = nx.cycle_graph(8)
-    cases.append(Case("transforms", "Line L(C8) — relabel", L(C8), relabel_graph(L(C8), seed=8), True))
-    cases.append(Case("transforms", "Line L(P5) vs L(P6)", L(nx.path_graph(5)), L(P6), False))
+    # Each transformed graph is built once and shared by the cases that use it
+    L_P6 = L(nx.path_graph(6))
+    cases.append(Case("transforms", "Line L(P6) — relabel", L_P6, relabel_graph(L_P6, seed=6), True))
+    L_C8 = L(nx.cycle_graph(8))
+    cases.append(Case("transforms", "Line L(C8) — relabel", L_C8, relabel_graph(L_C8, seed=8), True))
+    cases.append(Case("transforms", "Line L(P5) vs L(P6)", L(nx.path_graph(5)), L_P6, False))
 
     # Complement transforms
     comp = nx.complement
-    # Self-complementary: C5 is not self-complementary; use Paley(5) which is C5
+    # Self-complementary: C5 is Paley(5), so its complement is again a 5-cycle
     C5 = nx.cycle_graph(5)
-    cases.append(Case("transforms", "C5 vs complement(C5)", C5, comp(C5), False))
+    cases.append(Case("transforms", "C5 vs complement(C5)", C5, comp(C5), True))
     # Add a known self-complementary graph: 4-vertex path P4 is self-complementary
     P4 = nx.path_graph(4)
     cases.append(Case("transforms", "Self-complementary P4 vs complement(P4)", P4, comp(P4), True))
@@ -36,8 +37,8 @@ def build_cases() -> List[Case]:
     # Keep complement relabel checks instead
     C4 = nx.cycle_graph(4)
     cases.append(Case("transforms", "C4 vs complement(C4)", C4, comp(C4), False))
-    P = nx.petersen_graph()
-    cases.append(Case("transforms", "Complement(Petersen) — relabel", comp(P), relabel_graph(comp(P), seed=10), True))
+    comp_P = comp(nx.petersen_graph())
+    cases.append(Case("transforms", "Complement(Petersen) — relabel", comp_P, relabel_graph(comp_P, seed=10), True))
 
     return cases
 
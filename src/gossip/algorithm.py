@@ -2,9 +2,221 @@
 Core gossip fingerprinting algorithm for graph isomorphism testing.
 """
 
-from typing import Dict, List, Set, Tuple, Any, Optional
-from collections import defaultdict
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Any, cast
+from collections import Counter
 import networkx as nx
+import numpy as np
+
+
+_ADJACENCY_CACHE_KEY = "gossip_adjacency"
+_FINGERPRINT_CACHE_KEY = "gossip_fingerprints"
+_COLOR_HISTOGRAM_CACHE_KEY = "gossip_color_histogram"
+
+# Graphs with at least this many edges and this density run on the boolean-matrix
+# kernel; below that, per-round NumPy overhead outweighs the Python edge loop
+DENSE_MIN_EDGES = 1000
+DENSE_MIN_DENSITY = 0.05
+DENSE_MAX_VERTICES = 4096
+
+# Rounds of 1-WL color refinement used as a reject filter in compare
+COLOR_REFINEMENT_ROUNDS = 3
+
+# Color refinement hashes on NumPy arrays once the adjacency lists hold this many
+# entries; below that, hashing Python tuples is cheaper than setting up the arrays
+VECTOR_REFINEMENT_MIN_ENTRIES = 128
+
+
+def _graph_cache(G: nx.Graph) -> Optional[Dict[Any, Any]]:
+    """
+    Return the dict to memoize results on G, or None if G must not be used.
+
+    NetworkX clears ``G.__networkx_cache__`` whenever the graph is mutated
+    through its API, so results cached there never go stale. Views are the
+    exception: a subgraph or reverse view reads its base graph's data, but
+    mutating the base graph clears only the base graph's cache. Every view
+    is frozen, so frozen graphs are not memoized on.
+    """
+    if nx.is_frozen(G):
+        return None
+    return getattr(G, "__networkx_cache__", None)
+
+
+def _graph_adjacency(G: nx.Graph) -> Dict[Any, List[Any]]:
+    """
+    Return the adjacency list of G, memoized on the graph itself (see ``_graph_cache``).
+
+    The cached lists are reused across repeated compare calls on the same
+    graph object.
+    """
+    cache = _graph_cache(G)
+    if cache is None:
+        return {v: list(G.neighbors(v)) for v in G.nodes()}
+    adjacency = cast(Optional[Dict[Any, List[Any]]], cache.get(_ADJACENCY_CACHE_KEY))
+    if adjacency is None:
+        adjacency = {v: list(G.neighbors(v)) for v in G.nodes()}
+        cache[_ADJACENCY_CACHE_KEY] = adjacency
+    return adjacency
+
+
+def _index_adjacency(adjacency: Mapping[Any, Sequence[Any]]) -> List[List[int]]:
+    """
+    Relabel vertices to ``0..n-1`` in adjacency order.
+
+    Integer labels let per-run state live in flat lists. Repeated neighbor
+    entries are dropped, so each edge appears once per endpoint.
+
+    The kernels treat the lists as an undirected graph (an edge is taken from
+    its lower endpoint, and reachability is assumed to be symmetric), so a
+    directed adjacency gets the reverse of every arc added. Its fingerprint
+    is then that of the underlying undirected graph, which isomorphic
+    digraphs share whatever their node and edge insertion order.
+    """
+    index = {v: i for i, v in enumerate(adjacency)}
+    neighbors = [dict.fromkeys(index[u] for u in nbrs) for nbrs in adjacency.values()]
+    for v, nbrs in enumerate(neighbors):
+        for u in nbrs:
+            # No-op for undirected input; u == v is already a key of nbrs
+            neighbors[u][v] = None
+    return [list(nbrs) for nbrs in neighbors]
+
+
+def _refined_color_histogram(
+    adjacency: Mapping[Any, Sequence[Any]],
+    rounds: int = COLOR_REFINEMENT_ROUNDS
+) -> Counter:
+    """
+    Multiset of vertex colors after a few rounds of 1-WL color refinement.
+
+    Each round recolors a vertex by its color together with the sorted colors
+    of its neighbors. Isomorphic graphs always yield equal histograms, so a
+    mismatch is a cheap proof of non-isomorphism. Equal colors do not imply
+    equal gossip fingerprints (all vertices of a regular graph share one
+    color), so this is only used to reject, never to skip start vertices.
+
+    Larger graphs refine on flat arrays instead. The adjacency entry count is
+    itself an invariant, so two graphs that could be isomorphic always take
+    the same path and their histograms stay comparable.
+    """
+    if sum(len(nbrs) for nbrs in adjacency.values()) >= VECTOR_REFINEMENT_MIN_ENTRIES:
+        return _vectorized_color_histogram(adjacency, rounds)
+    color = {v: len(nbrs) for v, nbrs in adjacency.items()}
+    for _ in range(rounds):
+        color = {
+            v: hash((color[v], tuple(sorted(color[u] for u in nbrs))))
+            for v, nbrs in adjacency.items()
+        }
+    return Counter(color.values())
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: a bijective scramble of uint64 values (arithmetic wraps)."""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    x = x ^ (x >> np.uint64(31))
+    return x
+
+
+def _vectorized_color_histogram(adjacency: Mapping[Any, Sequence[Any]], rounds: int) -> Counter:
+    """
+    ``_refined_color_histogram`` on flat arrays.
+
+    A vertex's new color scrambles its old color together with the wrapping
+    sum of its neighbors' scrambled colors. The sum does not depend on
+    neighbor order, so it hashes the neighbor multiset without sorting, and
+    equal multisets always hash equally. A rare collision can only make the
+    filter miss a reject, never reject isomorphic graphs.
+    """
+    index = {v: i for i, v in enumerate(adjacency)}
+    degrees = np.fromiter((len(nbrs) for nbrs in adjacency.values()), dtype=np.int64, count=len(adjacency))
+    total = int(degrees.sum())
+    neighbors = np.fromiter((index[u] for nbrs in adjacency.values() for u in nbrs), dtype=np.intp, count=total)
+    # Row starts for reduceat; the zero appended after the gathered colors gives
+    # trailing isolated vertices a valid start, and their sums are zeroed anyway
+    starts = np.concatenate(([0], np.cumsum(degrees)[:-1]))
+    isolated = degrees == 0
+
+    color = degrees.astype(np.uint64)
+    for _ in range(rounds):
+        gathered = np.append(_mix64(color)[neighbors], np.uint64(0))
+        sums = np.add.reduceat(gathered, starts)
+        sums[isolated] = 0
+        color = _mix64(color * np.uint64(0x9E3779B97F4A7C15) + sums)
+
+    values, counts = np.unique(color, return_counts=True)
+    return Counter(dict(zip(values.tolist(), counts.tolist())))
+
+
+def _graph_color_histogram(G: nx.Graph, adjacency: Mapping[Any, Sequence[Any]]) -> Counter:
+    """Return ``_refined_color_histogram(adjacency)``, memoized on G like its adjacency list."""
+    cache = _graph_cache(G)
+    if cache is None:
+        return _refined_color_histogram(adjacency)
+    histogram = cast(Optional[Counter], cache.get(_COLOR_HISTOGRAM_CACHE_KEY))
+    if histogram is None:
+        histogram = cache[_COLOR_HISTOGRAM_CACHE_KEY] = _refined_color_histogram(adjacency)
+    return histogram
+
+
+def _adjacency_matrix(neighbors: List[List[int]]) -> np.ndarray:
+    """Boolean adjacency matrix of an index adjacency list (self-loops on the diagonal)."""
+    n = len(neighbors)
+    matrix = np.zeros((n, n), dtype=bool)
+    rows = np.repeat(np.arange(n), [len(nbrs) for nbrs in neighbors])
+    cols = np.fromiter((u for nbrs in neighbors for u in nbrs), dtype=np.intp, count=len(rows))
+    matrix[rows, cols] = True
+    return matrix
+
+
+def _component_sizes(matrix: np.ndarray) -> Tuple[int, ...]:
+    """Sorted connected-component sizes of the graph with boolean adjacency ``matrix``."""
+    remaining = np.ones(len(matrix), dtype=bool)
+    sizes = []
+    while remaining.any():
+        reached = np.zeros(len(matrix), dtype=bool)
+        reached[np.argmax(remaining)] = True
+        while True:
+            grown = reached | matrix[reached].any(axis=0)
+            if np.array_equal(grown, reached):
+                break
+            reached = grown
+        sizes.append(int(reached.sum()))
+        remaining &= ~reached
+    return tuple(sorted(sizes))
+
+
+def _event_field_width(num_vertices: int) -> int:
+    """
+    Bit width for packed event fields.
+
+    The iteration index and the number of frontier groups are at most the
+    number of vertices. On the symmetric, duplicate-free lists from
+    ``_index_adjacency`` every edge is transmitted once and bumps each
+    endpoint at most once, and a self-loop bumps its vertex twice. A hear
+    count is therefore at most ``n + 1``, so every field fits in this many
+    bits. (Raw directed out-lists would break this bound, which is one reason
+    they are symmetrized first.) The width depends only on the order of the
+    graph, so packed fingerprints of equal-order graphs are directly
+    comparable.
+    """
+    return (num_vertices + 2).bit_length()
+
+
+def _unpack_event(key: int, width: int) -> Tuple[int, int, int, int, int]:
+    """
+    Decode a packed transmission event back into its tuple form.
+
+    Events are packed as ``iteration | kind | a | b | num_groups`` with a
+    single bit for ``kind`` and ``width`` bits for each of the last three
+    fields, so integer order matches tuple order.
+    """
+    mask = (1 << width) - 1
+    num_groups = key & mask
+    b = (key >> width) & mask
+    a = (key >> 2 * width) & mask
+    head = key >> 3 * width
+    return head >> 1, head & 1, a, b, num_groups
 
 
 class GossipFingerprint:
@@ -15,16 +227,32 @@ class GossipFingerprint:
     creating a unique fingerprint for each graph structure.
     """
 
-    def __init__(self, normalize: bool = True):
+    def __init__(
+        self,
+        normalize: bool = True,
+        use_frontier_shape: bool = True,
+        cache_fingerprints: bool = False
+    ):
         """
         Initialize the gossip fingerprint algorithm.
 
         Args:
             normalize: Whether to normalize fingerprints for comparison
+            use_frontier_shape: Whether to record the per-round frontier sentinel
+                (component sizes of the frontier-induced subgraph). Turning it off
+                skips the component search each round, but the weaker fingerprint
+                no longer separates e.g. Rook R(4,4) from Shrikhande.
+            cache_fingerprints: Whether compare keeps each graph's per-vertex
+                fingerprint multiset on the graph. This saves recomputing it when
+                one graph is compared many times, but the multiset holds
+                O(n * m) ints, stays until the graph is mutated, and is pickled
+                along with the graph.
         """
         self.normalize = normalize
+        self.use_frontier_shape = use_frontier_shape
+        self.cache_fingerprints = cache_fingerprints
 
-    def compute(self, adjacency: Dict[Any, List[Any]]) -> Tuple[Tuple, ...]:
+    def compute(self, adjacency: Mapping[Any, Sequence[Any]]) -> Tuple[Tuple, ...]:
         """
         Compute the gossip fingerprint for a graph.
 
@@ -32,115 +260,154 @@ class GossipFingerprint:
             adjacency: Adjacency list representation of the graph
 
         Returns:
-            Sorted tuple of vertex fingerprints
+            Sorted tuple of vertex fingerprints. Each is a pair
+            ``(shapes, events)``: ``shapes`` holds the sorted frontier
+            component sizes of every round (empty when
+            ``use_frontier_shape`` is off), and ``events`` is the sorted
+            timeline of packed transmission events (see ``_unpack_event``).
         """
-        fingerprints = {}
+        return tuple(sorted(self._vertex_fingerprints(adjacency)))
 
-        for start_vertex in adjacency:
-            fingerprint = self._compute_vertex_fingerprint(adjacency, start_vertex)
-            fingerprints[start_vertex] = fingerprint
+    def _vertex_fingerprints(
+        self,
+        adjacency: Mapping[Any, Sequence[Any]]
+    ) -> Iterator[Tuple[Tuple[Tuple[int, ...], ...], Tuple[int, ...]]]:
+        """
+        Yield the fingerprint of every start vertex, in adjacency order.
 
-        return tuple(sorted(fingerprints.values()))
+        Fingerprints are produced lazily so that callers comparing graphs can
+        stop at the first vertex that has no counterpart.
+        """
+        neighbors = _index_adjacency(adjacency)
+        width = _event_field_width(len(neighbors))
+
+        n = len(neighbors)
+        num_arcs = sum(len(nbrs) for nbrs in neighbors)
+        if (
+            n <= DENSE_MAX_VERTICES
+            and num_arcs >= 2 * DENSE_MIN_EDGES
+            and num_arcs >= DENSE_MIN_DENSITY * n * (n - 1)
+        ):
+            matrix = _adjacency_matrix(neighbors)
+            for start_vertex in range(n):
+                yield self._compute_vertex_fingerprint_dense(matrix, start_vertex, width)
+            return
+
+        # Scratch buffer shared by every start vertex; each run resets what it touched
+        gossip_heard_count = [0] * len(neighbors)
+
+        for start_vertex in range(len(neighbors)):
+            yield self._compute_vertex_fingerprint(
+                neighbors, start_vertex, width, gossip_heard_count
+            )
 
     def _compute_vertex_fingerprint(
         self,
-        adjacency: Dict[Any, List[Any]],
-        start_vertex: Any
-    ):
+        neighbors: List[List[int]],
+        start_vertex: int,
+        width: int,
+        gossip_heard_count: List[int]
+    ) -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[int, ...]]:
         """
         Compute fingerprint for a single starting vertex.
 
+        Transmission events ``(iteration, kind, a, b, num_groups)`` are packed
+        into single integers with ``width``-bit fields (see ``_unpack_event``),
+        so the timeline sort compares machine-word ints instead of tuples.
+        Because the fields have fixed width, the packed order equals the
+        tuple order.
+
         Args:
-            adjacency: Graph adjacency list
-            start_vertex: Vertex to start gossip from
+            neighbors: Index adjacency list (see ``_index_adjacency``)
+            start_vertex: Index of the vertex to start gossip from
+            width: Bit width of each packed event field
+            gossip_heard_count: Zeroed per-vertex scratch counts, zeroed again on return
 
         Returns:
-            Sorted timeline of gossip events for the start vertex
+            Pair of (per-round frontier component sizes, sorted packed events)
         """
         # Spreaders are vertices that currently possess the gossip and may spread it
         spreaders = {start_vertex}
         new_spreaders = {start_vertex}
-        seen_edges = set()
+        shapes = []
         timeline = []
         iteration = 0
 
-        # Global gossip-heard counts from the start (no per-round reset)
-        gossip_heard_count = {v: 0 for v in adjacency}
-
+        # Every edge is transmitted exactly once, in the round after its first endpoint
+        # hears. So once everyone has heard, at most one more round follows, and it
+        # carries only the edges inside the last frontier; no separate bulk pass is needed.
         while new_spreaders:
             # Receivers are vertices that newly receive the gossip in this iteration
-            receivers = set()
-
-            # Collect gossip transmissions and update global hear counts in a single pass
-            gossips = []
+            receivers: Set[int] = set()
+
+            # Collect gossip transmissions and update global hear counts in a single pass.
+            # An edge is new this round exactly when its far end is in the frontier too
+            # (seen from both ends, so taken from the lower one) or has not heard yet;
+            # edges to earlier spreaders went out in a previous round. This also fixes
+            # each gossip's role: it reaches someone who already heard, or a new receiver.
+            novel_gossips: List[Tuple[int, int]] = []
+            neutral_gossips: List[Tuple[int, int]] = []
+            # Bound methods hoisted out of the edge loop (it runs once per edge per start)
+            add_novel = novel_gossips.append
+            add_neutral = neutral_gossips.append
+            add_receiver = receivers.add
             for current_spreader in new_spreaders:
-                for neighbor in adjacency[current_spreader]:
-                    edge = tuple(sorted((current_spreader, neighbor)))
-                    if edge in seen_edges:
-                        continue
-                    seen_edges.add(edge)
-                    gossips.append((current_spreader, neighbor))
-                    # Receiver hears once; spreader only bumps if contacting someone who already heard
-                    if neighbor in spreaders:
+                for neighbor in neighbors[current_spreader]:
+                    if neighbor in new_spreaders:
+                        if neighbor < current_spreader:
+                            continue
+                        # Spreader only bumps when contacting someone who already heard
                         gossip_heard_count[current_spreader] += 1
+                        add_neutral((current_spreader, neighbor))
+                    elif neighbor in spreaders:
+                        continue
+                    else:
+                        add_novel((current_spreader, neighbor))
+                        add_receiver(neighbor)
+                    # Receiver hears once
                     gossip_heard_count[neighbor] += 1
 
             # Frontier-shape sentinel: sorted component sizes in G[F_t]
-            # Build DSU on frontier vertices and union while iterating edges above
-            frontier = new_spreaders
-            if frontier:
-                parent: Dict[Any, Any] = {v: v for v in frontier}
-                rank: Dict[Any, int] = {v: 0 for v in frontier}
-
-                def _find(x: Any) -> Any:
-                    while parent[x] != x:
-                        parent[x] = parent[parent[x]]
-                        x = parent[x]
-                    return x
-
-                def _union(x: Any, y: Any) -> None:
-                    rx, ry = _find(x), _find(y)
-                    if rx == ry:
-                        return
-                    if rank[rx] < rank[ry]:
-                        parent[rx] = ry
-                    elif rank[rx] > rank[ry]:
-                        parent[ry] = rx
-                    else:
-                        parent[ry] = rx
-                        rank[rx] += 1
-
-                for u, v in gossips:
-                    if u in frontier and v in frontier:
-                        _union(u, v)
-
-                # Compute sorted component sizes vector
-                comp_sizes: Dict[Any, int] = {}
+            # Frontier vertices heard in the same round, so every frontier-frontier
+            # edge is transmitted this round; a plain traversal of G[F_t] suffices.
+            # The index lists are symmetric (see _index_adjacency), so the traversal
+            # follows the same undirected edges the old union-find merged, and
+            # component sizes do not depend on which frontier vertex comes first.
+            num_groups = 0
+            if self.use_frontier_shape:
+                frontier = new_spreaders
+                visited = set()
+                comp_sizes = []
                 for v in frontier:
-                    r = _find(v)
-                    comp_sizes[r] = comp_sizes.get(r, 0) + 1
-                sizes_sorted = tuple(sorted(comp_sizes.values()))
+                    if v in visited:
+                        continue
+                    visited.add(v)
+                    stack = [v]
+                    size = 0
+                    while stack:
+                        x = stack.pop()
+                        size += 1
+                        for y in neighbors[x]:
+                            if y in frontier and y not in visited:
+                                visited.add(y)
+                                stack.append(y)
+                    comp_sizes.append(size)
+                sizes_sorted = tuple(sorted(comp_sizes))
                 num_groups = len(sizes_sorted)
-                timeline.append((iteration, -1, sizes_sorted))
-
-            # Emit events using hear counts; include current number of frontier groups
-            for u, v in gossips:
-                u_is_spreader = u in spreaders
-                v_is_spreader = v in spreaders
-
-                if u_is_spreader and not v_is_spreader:
-                    timeline.append((iteration, 1, gossip_heard_count[u], gossip_heard_count[v], num_groups))
-                    receivers.add(v)
-                elif v_is_spreader and not u_is_spreader:
-                    timeline.append((iteration, 1, gossip_heard_count[v], gossip_heard_count[u], num_groups))
-                    receivers.add(u)
-                else:
-                    a = gossip_heard_count[u]
-                    b = gossip_heard_count[v]
-                    if a <= b:
-                        timeline.append((iteration, 0, a, b, num_groups))
-                    else:
-                        timeline.append((iteration, 0, b, a, num_groups))
+                shapes.append(sizes_sorted)
+
+            # Emit events using hear counts; include current number of frontier groups.
+            # Packed layout: iteration | kind | a | b | num_groups (see _unpack_event).
+            novel_prefix = ((iteration << 1) | 1) << width
+            neutral_prefix = (iteration << 1) << width
+            for u, v in novel_gossips:
+                a, b = gossip_heard_count[u], gossip_heard_count[v]
+                timeline.append((((novel_prefix | a) << width | b) << width) | num_groups)
+            for u, v in neutral_gossips:
+                a, b = gossip_heard_count[u], gossip_heard_count[v]
+                if a > b:
+                    a, b = b, a
+                timeline.append((((neutral_prefix | a) << width | b) << width) | num_groups)
 
             # spreaders is cumulative set of all vertices that have ever heard the gossip
             spreaders = spreaders | receivers
@@ -148,24 +415,110 @@ class GossipFingerprint:
             new_spreaders = receivers
             iteration += 1
 
-        return tuple(sorted(timeline))
+        # Every counted vertex ended up informed, so this restores the scratch buffers
+        for v in spreaders:
+            gossip_heard_count[v] = 0
+
+        timeline.sort()
+        return tuple(shapes), tuple(timeline)
+
+    def _compute_vertex_fingerprint_dense(
+        self,
+        matrix: np.ndarray,
+        start_vertex: int,
+        width: int
+    ) -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[int, ...]]:
+        """
+        Compute fingerprint for a single starting vertex of a dense graph.
+
+        Same result as ``_compute_vertex_fingerprint``, but each round runs as
+        a few NumPy operations on the boolean adjacency matrix. A round
+        transmits exactly the edges from the frontier to vertices that are in
+        the frontier or have not heard yet, so no seen-edge set is needed.
+
+        Args:
+            matrix: Boolean adjacency matrix (see ``_adjacency_matrix``)
+            start_vertex: Index of the vertex to start gossip from
+            width: Bit width of each packed event field
+
+        Returns:
+            Pair of (per-round frontier component sizes, sorted packed events)
+        """
+        gossip_heard_count = np.zeros(len(matrix), dtype=np.int64)
+        informed = np.zeros(len(matrix), dtype=bool)
+        informed[start_vertex] = True
+        frontier = np.array([start_vertex])
+        shapes = []
+        events = []
+        iteration = 0
+
+        while frontier.size:
+            rows = matrix[frontier]
+            inner = rows[:, frontier]
+            outside = np.flatnonzero(~informed)
+            outer = rows[:, outside]
+
+            # Intra-frontier gossips bump both ends (a self-loop bumps its vertex twice);
+            # gossips to vertices that had not heard bump the receiver only
+            gossip_heard_count[frontier] += inner.sum(axis=1) + inner.diagonal()
+            gossip_heard_count[outside] += outer.sum(axis=0)
+
+            num_groups = 0
+            if self.use_frontier_shape:
+                sizes_sorted = _component_sizes(inner)
+                num_groups = len(sizes_sorted)
+                shapes.append(sizes_sorted)
+
+            # Same packed layout as the list-based kernel
+            spreader, receiver = np.nonzero(outer)
+            a = gossip_heard_count[frontier[spreader]]
+            b = gossip_heard_count[outside[receiver]]
+            novel_prefix = ((iteration << 1) | 1) << width
+            events.append((((novel_prefix | a) << width | b) << width) | num_groups)
+
+            u, v = np.nonzero(np.triu(inner))
+            a = gossip_heard_count[frontier[u]]
+            b = gossip_heard_count[frontier[v]]
+            neutral_prefix = (iteration << 1) << width
+            events.append(
+                (((neutral_prefix | np.minimum(a, b)) << width | np.maximum(a, b)) << width)
+                | num_groups
+            )
+
+            frontier = outside[outer.any(axis=0)]
+            informed[frontier] = True
+            iteration += 1
+
+        timeline = np.sort(np.concatenate(events))
+        return tuple(shapes), tuple(timeline.tolist())
 
     def compute_raw_fingerprints(self, G: nx.Graph) -> Dict[Any, Tuple[Tuple, ...]]:
         """
         Compute per-vertex raw fingerprints for all start vertices.
 
-        Returns a mapping from start vertex to its sorted timeline of events.
+        Returns a mapping from start vertex to its sorted timeline of events,
+        unpacked into readable ``(iteration, kind, ...)`` tuples for debugging.
         """
-        adjacency = {v: list(G.neighbors(v)) for v in G.nodes()}
+        adjacency = _graph_adjacency(G)
+        width = _event_field_width(len(adjacency))
         per_vertex: Dict[Any, Tuple[Tuple, ...]] = {}
-        for v in adjacency:
-            per_vertex[v] = self._compute_vertex_fingerprint(adjacency, v)
+        for v, (shapes, packed) in zip(adjacency, self._vertex_fingerprints(adjacency)):
+            timeline: List[Tuple[Any, ...]] = [
+                (iteration, -1, sizes) for iteration, sizes in enumerate(shapes)
+            ]
+            timeline.extend(_unpack_event(key, width) for key in packed)
+            per_vertex[v] = tuple(sorted(timeline))
         return per_vertex
 
     def compare(self, G1: nx.Graph, G2: nx.Graph) -> bool:
         """
         Compare two NetworkX graphs using gossip fingerprints.
 
+        The adjacency lists and color histograms of both graphs are memoized
+        on them (not on NetworkX views); NetworkX drops them when a graph is
+        mutated. The per-vertex fingerprints are kept only with
+        ``cache_fingerprints=True``.
+
         Args:
             G1: First graph
             G2: Second graph
@@ -173,17 +526,68 @@ class GossipFingerprint:
         Returns:
             True if graphs have identical fingerprints
         """
-        adj1 = {v: list(G1.neighbors(v)) for v in G1.nodes()}
-        adj2 = {v: list(G2.neighbors(v)) for v in G2.nodes()}
+        # Cheap invariants first: any mismatch here means the graphs cannot be isomorphic
+        if G1.number_of_nodes() != G2.number_of_nodes():
+            return False
+        if G1.number_of_edges() != G2.number_of_edges():
+            return False
+        # Edgeless graphs of the same order (including the empty graph) are isomorphic
+        if G1.number_of_edges() == 0:
+            return True
+        if sorted(d for _, d in G1.degree()) != sorted(d for _, d in G2.degree()):
+            return False
+
+        adj1 = _graph_adjacency(G1)
+        adj2 = _graph_adjacency(G2)
+
+        if _graph_color_histogram(G1, adj1) != _graph_color_histogram(G2, adj2):
+            return False
+
+        # Multiset equality of per-vertex fingerprints: count G1's, then consume
+        # them with G2's and stop at the first fingerprint G1 does not have.
+        # Both graphs have the same order here, so the packed encodings agree.
+        counts1 = self._fingerprint_counts(G1, adj1)
+        cache2 = self._fingerprint_cache(G2)
+        cache_key = (_FINGERPRINT_CACHE_KEY, self.use_frontier_shape)
+        if cache2 is not None and cache_key in cache2:
+            return counts1 == cast(Counter, cache2[cache_key])
+
+        unmatched = counts1.copy()
+        for fingerprint in self._vertex_fingerprints(adj2):
+            if unmatched[fingerprint] == 0:
+                return False
+            unmatched[fingerprint] -= 1
+
+        # Every fingerprint matched, so G2's multiset is G1's
+        if cache2 is not None:
+            cache2[cache_key] = counts1
+        return True
+
+    def _fingerprint_counts(self, G: nx.Graph, adjacency: Mapping[Any, Sequence[Any]]) -> Counter:
+        """
+        Multiset of G's per-vertex fingerprints, memoized on G with ``cache_fingerprints``.
 
-        fp1 = self.compute(adj1)
-        fp2 = self.compute(adj2)
+        A base graph compared against several relabelings is then fingerprinted
+        once. The key includes ``use_frontier_shape`` because the two settings
+        produce different fingerprints. The returned Counter is shared, so
+        callers must copy it before changing it.
+        """
+        cache = self._fingerprint_cache(G)
+        cache_key = (_FINGERPRINT_CACHE_KEY, self.use_frontier_shape)
+        if cache is not None and cache_key in cache:
+            return cast(Counter, cache[cache_key])
+        counts = Counter(self._vertex_fingerprints(adjacency))
+        if cache is not None:
+            cache[cache_key] = counts
+        return counts
 
-        return fp1 == fp2
+    def _fingerprint_cache(self, G: nx.Graph) -> Optional[Dict[Any, Any]]:
+        """Where to memoize G's fingerprint multiset, or None when that is disabled."""
+        return _graph_cache(G) if self.cache_fingerprints else None
 
 
 def gossip_fingerprint(
-    adjacency: Dict[Any, List[Any]],
+    adjacency: Mapping[Any, Sequence[Any]],
     normalize: bool = True
 ) -> Tuple[Tuple, ...]:
     """
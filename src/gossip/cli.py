@@ -52,7 +52,8 @@ def load_graph(filepath: Path, format: str = "auto") -> nx.Graph:
 
     try:
         if format == "edgelist":
-            return nx.read_edgelist(filepath)
+            # Only structure is compared, so skip literal_eval of each line's data column
+            return nx.read_edgelist(filepath, data=False)
         elif format == "gml":
             return nx.read_gml(filepath)
         elif format == "graphml":
@@ -156,9 +157,8 @@ def compare_graphs_cli(
         if gossip_match != nx_iso:
             print("\nWARNING: Gossip result differs from NetworkX!")
             # Print per-vertex fingerprints to aid debugging
-            gf_dbg = GossipFingerprint()
-            fp1 = gf_dbg.compute_raw_fingerprints(graph1)
-            fp2 = gf_dbg.compute_raw_fingerprints(graph2)
+            fp1 = gf.compute_raw_fingerprints(graph1)
+            fp2 = gf.compute_raw_fingerprints(graph2)
             print("\nPer-vertex fingerprints (Graph 1):")
             for v in sorted(graph1.nodes()):
                 print(f"  {v}: {fp1[v]}")
@@ -2,24 +2,93 @@
 Utility functions for the gossip graph isomorphism algorithm.
 """
 
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Callable, Sequence, Iterator, Iterable, Mapping, Union, cast
+from concurrent.futures import ProcessPoolExecutor
 import networkx as nx
-import random
+import numpy as np
+import functools
 import itertools
 from collections import defaultdict
 
 
-def graph_to_adjacency_list(graph: nx.Graph) -> Dict[Any, List[Any]]:
+_CSR_CACHE_KEY = "gossip_csr"
+_PACKED_ROWS_CACHE_KEY = "gossip_packed_rows"
+
+# are_isomorphic counts triangles on bit-packed adjacency rows (n^2 / 8 bytes)
+# up to this order and falls back to nx.fast_could_be_isomorphic above it
+TRIANGLE_BITSET_MAX_VERTICES = 4096
+
+
+def graph_to_adjacency_list(
+    graph: nx.Graph,
+    as_view: bool = False
+) -> Mapping[Any, List[Any]]:
     """
     Convert a NetworkX graph to an adjacency list representation.
 
     Args:
         graph: NetworkX graph object
+        as_view: Return a CsrAdjacencyView that builds neighbor lists on access
+            instead of materializing one list per vertex up front
 
     Returns:
         Dictionary mapping each vertex to its list of neighbors
     """
-    return {vertex: list(graph.neighbors(vertex)) for vertex in graph.nodes()}
+    if as_view:
+        return CsrAdjacencyView(*graph_to_csr(graph))
+    return {vertex: list(neighbors) for vertex, neighbors in graph.adjacency()}
+
+
+class CsrAdjacencyView(Mapping):
+    """
+    Read-only adjacency list backed by CSR arrays (see graph_to_csr).
+
+    Only the two index arrays and the node list are stored; the neighbor list
+    of a vertex is created when it is looked up.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, nodes: List[Any]):
+        self._indptr = indptr
+        self._indices = indices
+        self._nodes = nodes
+        self._index = {vertex: i for i, vertex in enumerate(nodes)}
+
+    def __getitem__(self, vertex: Any) -> List[Any]:
+        i = self._index[vertex]
+        neighbors = self._indices[self._indptr[i]:self._indptr[i + 1]]
+        return [self._nodes[j] for j in neighbors.tolist()]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+
+def graph_to_csr(graph: nx.Graph) -> Tuple[np.ndarray, np.ndarray, List[Any]]:
+    """
+    Convert a NetworkX graph to a compressed sparse row (CSR) layout.
+
+    The neighbors of the vertex nodes[i] are indices[indptr[i]:indptr[i + 1]],
+    given as positions in nodes, and its degree is indptr[i + 1] - indptr[i].
+
+    Args:
+        graph: NetworkX graph object
+
+    Returns:
+        Tuple of (indptr, indices, nodes)
+    """
+    nodes = list(graph.nodes())
+    index = {vertex: i for i, vertex in enumerate(nodes)}
+
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    np.cumsum([len(neighbors) for _, neighbors in graph.adjacency()], out=indptr[1:])
+    indices = np.fromiter(
+        (index[neighbor] for _, neighbors in graph.adjacency() for neighbor in neighbors),
+        dtype=np.int64,
+        count=int(indptr[-1]),
+    )
+    return indptr, indices, nodes
 
 
 def adjacency_to_graph(adjacency: Dict[Any, List[Any]]) -> nx.Graph:
@@ -66,7 +135,8 @@ def generate_random_regular_graph(
 
 def generate_cfi_pair(
     base_graph: nx.Graph,
-    flip_edges: Optional[Set[Tuple[Any, Any]]] = None
+    flip_edges: Optional[Iterable[Tuple[Any, Any]]] = None,
+    seed: Optional[Union[int, np.random.Generator]] = None
 ) -> Tuple[nx.Graph, nx.Graph]:
     """
     Generate a pair of Cai-Fürer-Immerman (CFI) graphs.
@@ -76,34 +146,41 @@ def generate_cfi_pair(
     Args:
         base_graph: Base graph to construct CFI graphs from
         flip_edges: Edges to flip in the construction (if None, randomly select)
+        seed: Random seed or NumPy Generator for the flip selection when flip_edges is None
 
     Returns:
         Tuple of two CFI graphs
     """
+    base_edges = list(base_graph.edges())
     if flip_edges is None:
-        # Randomly select edges to flip
-        edges = list(base_graph.edges())
-        flip_edges = set(random.sample(edges, k=len(edges) // 2))
+        # Randomly select half of the edges to flip
+        flipped = np.zeros(len(base_edges), dtype=bool)
+        rng = np.random.default_rng(seed)
+        flipped[rng.choice(len(base_edges), size=len(base_edges) // 2, replace=False)] = True
+    else:
+        # Accept any collection of edges; a set keeps each lookup O(1)
+        flip_set = set(flip_edges)
+        flipped = np.fromiter((edge in flip_set for edge in base_edges), dtype=bool, count=len(base_edges))
 
-    def build_cfi(flip: bool = False) -> nx.Graph:
-        G = nx.Graph()
+    # Gadget vertex i of base vertex v is 3 * index[v] + i; its center is 3 * n + index[v]
+    index = {v: idx for idx, v in enumerate(base_graph.nodes())}
+    n = len(index)
+
+    # Add gadget vertices for each original vertex
+    gadget_edges = [(3 * n + idx, 3 * idx + i) for idx in index.values() for i in range(3)]
 
-        # Add gadget vertices for each original vertex
-        for v in base_graph.nodes():
-            center = f"{v}_c"
-            for i in range(3):
-                G.add_edge(center, f"{v}_{i}")
+    def build_cfi(flip: bool = False) -> nx.Graph:
+        edges = list(gadget_edges)
 
         # Connect gadgets according to original edges
-        for u, v in base_graph.edges():
-            for i in range(3):
-                if flip and (u, v) in flip_edges:
-                    # Flip the connection pattern
-                    G.add_edge(f"{u}_{i}", f"{v}_{(i+1)%3}")
-                else:
-                    # Regular connection pattern
-                    G.add_edge(f"{u}_{i}", f"{v}_{i}")
+        for (u, v), is_flipped in zip(base_edges, flipped):
+            # Flipped edges shift the connection pattern by one
+            shift = 1 if flip and is_flipped else 0
+            base_u, base_v = 3 * index[u], 3 * index[v]
+            edges += [(base_u + i, base_v + (i + shift) % 3) for i in range(3)]
 
+        G = nx.Graph()
+        G.add_edges_from(edges)
         return G
 
     return build_cfi(False), build_cfi(True)
@@ -132,17 +209,33 @@ def generate_strongly_regular_graph(
         return None
 
     # For small cases, use known constructions
-    if (v, k, l, m) == (16, 6, 2, 2):
-        return _srg_16_6_2_2()
-    elif (v, k, l, m) == (25, 12, 5, 6):
-        return nx.paley_graph(25)
-    elif (v, k, l, m) == (13, 6, 2, 3):
-        return nx.paley_graph(13)
+    cached = _SRG_CACHE.get((v, k, l, m))
+    if cached is not None:
+        return cached.copy()
 
     # For other cases, return None (would need more complex constructions)
     return None
 
 
+_SRG_16_6_2_2_EDGES = (
+    (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6),
+    (1, 2), (1, 7), (1, 8), (1, 9), (1, 10),
+    (2, 3), (2, 11), (2, 12), (2, 13),
+    (3, 4), (3, 14), (3, 15),
+    (4, 5), (4, 7),
+    (5, 6), (5, 8),
+    (6, 9), (6, 10),
+    (7, 11), (7, 12),
+    (8, 11), (8, 13),
+    (9, 12), (9, 14),
+    (10, 13), (10, 15),
+    (11, 14),
+    (12, 15),
+    (13, 14),
+    (14, 15),
+)
+
+
 def _srg_16_6_2_2() -> nx.Graph:
     """
     Construct the strongly regular graph with parameters (16, 6, 2, 2).
@@ -150,28 +243,19 @@ def _srg_16_6_2_2() -> nx.Graph:
     Returns:
         SRG(16, 6, 2, 2) graph
     """
-    edges = [
-        (0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (0, 6),
-        (1, 2), (1, 7), (1, 8), (1, 9), (1, 10),
-        (2, 3), (2, 11), (2, 12), (2, 13),
-        (3, 4), (3, 14), (3, 15),
-        (4, 5), (4, 7),
-        (5, 6), (5, 8),
-        (6, 9), (6, 10),
-        (7, 11), (7, 12),
-        (8, 11), (8, 13),
-        (9, 12), (9, 14),
-        (10, 13), (10, 15),
-        (11, 14),
-        (12, 15),
-        (13, 14),
-        (14, 15)
-    ]
     G = nx.Graph()
-    G.add_edges_from(edges)
+    G.add_edges_from(_SRG_16_6_2_2_EDGES)
     return G
 
 
+# Known constructions are built once at import; callers get copies
+_SRG_CACHE = {
+    (16, 6, 2, 2): _srg_16_6_2_2(),
+    (25, 12, 5, 6): nx.paley_graph(25),
+    (13, 6, 2, 3): nx.paley_graph(13),
+}
+
+
 def generate_circulant_graph(n: int, connections: List[int]) -> nx.Graph:
     """
     Generate a circulant graph C_n(connections).
@@ -204,20 +288,20 @@ def generate_miyazaki_graph(n: int) -> nx.Graph:
     if n < 4 or n % 2 != 0:
         raise ValueError("n must be even and at least 4")
 
-    G = nx.Graph()
+    # Vertices 0..n-1 form cycle a and n..2n-1 form cycle b
+    a = range(n)
+    b = range(n, 2 * n)
 
     # Create two cycles
-    for i in range(n):
-        G.add_edge(f"a{i}", f"a{(i+1)%n}")
-        G.add_edge(f"b{i}", f"b{(i+1)%n}")
+    edges = [(a[i], a[(i + 1) % n]) for i in range(n)]
+    edges += [(b[i], b[(i + 1) % n]) for i in range(n)]
 
     # Add cross connections with twist
-    for i in range(n):
-        if i < n // 2:
-            G.add_edge(f"a{i}", f"b{i}")
-        else:
-            G.add_edge(f"a{i}", f"b{n-1-i}")
+    edges += [(a[i], b[i]) for i in range(n // 2)]
+    edges += [(a[i], b[n - 1 - i]) for i in range(n // 2, n)]
 
+    G = nx.Graph()
+    G.add_edges_from(edges)
     return G
 
 
@@ -235,22 +319,30 @@ def compute_graph_statistics(graph: nx.Graph) -> Dict[str, Any]:
         "num_vertices": graph.number_of_nodes(),
         "num_edges": graph.number_of_edges(),
         "density": nx.density(graph),
-        "is_connected": nx.is_connected(graph),
     }
 
+    if graph.is_directed() or stats["num_vertices"] == 0:
+        # Connectivity is undefined here; let NetworkX raise its usual error
+        nx.is_connected(graph)
+
+    # One BFS decides connectivity and doubles as the first eccentricity sweep
+    indptr, indices, _ = _graph_csr(graph)
+    dist = _bfs_distances(indptr, indices, 0)
+    stats["is_connected"] = bool((dist >= 0).all())
+
     if stats["is_connected"]:
-        stats["diameter"] = nx.diameter(graph)
-        stats["radius"] = nx.radius(graph)
+        stats["diameter"], stats["radius"] = _diameter_and_radius(indptr, indices, 0, dist)
 
-    degree_sequence = sorted([d for n, d in graph.degree()], reverse=True)
-    stats["max_degree"] = max(degree_sequence) if degree_sequence else 0
-    stats["min_degree"] = min(degree_sequence) if degree_sequence else 0
-    stats["avg_degree"] = sum(degree_sequence) / len(degree_sequence) if degree_sequence else 0
+    # Single pass over degree(), which (unlike CSR row lengths) counts a self-loop twice
+    degrees = np.fromiter((d for _, d in graph.degree()), dtype=np.int64, count=stats["num_vertices"])
+    stats["max_degree"] = int(degrees.max()) if degrees.size else 0
+    stats["min_degree"] = int(degrees.min()) if degrees.size else 0
+    stats["avg_degree"] = float(degrees.mean()) if degrees.size else 0
 
     # Check for regularity
-    if len(set(degree_sequence)) == 1:
+    if degrees.size and stats["max_degree"] == stats["min_degree"]:
         stats["is_regular"] = True
-        stats["regularity"] = degree_sequence[0]
+        stats["regularity"] = stats["max_degree"]
     else:
         stats["is_regular"] = False
         stats["regularity"] = None
@@ -258,6 +350,121 @@ def compute_graph_statistics(graph: nx.Graph) -> Dict[str, Any]:
     return stats
 
 
+def _bfs_distances(indptr: np.ndarray, indices: np.ndarray, source: int) -> np.ndarray:
+    """
+    Breadth-first search over a CSR graph, one whole level at a time.
+
+    Args:
+        indptr: CSR row pointers (see graph_to_csr)
+        indices: CSR neighbor indices
+        source: Index of the start vertex
+
+    Returns:
+        Array of hop distances from source (-1 for unreachable vertices)
+    """
+    n = len(indptr) - 1
+    dist = np.full(n, -1, dtype=np.int64)
+    dist[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    # Scratch slot per vertex used to drop duplicate discoveries without sorting
+    slot = np.empty(n, dtype=np.int64)
+    unvisited = n - 1
+    level = 0
+
+    # Stop as soon as every vertex is reached; the last level would only revisit edges
+    while frontier.size and unvisited:
+        level += 1
+        # Gather the neighbor slices of the whole frontier in one indexing step
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        neighbors = indices[offsets]
+        neighbors = neighbors[dist[neighbors] < 0]
+
+        # Each vertex keeps only the position of its last occurrence
+        positions = np.arange(neighbors.size)
+        slot[neighbors] = positions
+        frontier = neighbors[slot[neighbors] == positions]
+        dist[frontier] = level
+        unvisited -= frontier.size
+
+    return dist
+
+
+def _diameter_and_radius(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    source: int,
+    dist: np.ndarray
+) -> Tuple[int, int]:
+    """
+    Compute the diameter and radius of a connected graph with eccentricity bounds.
+
+    Every BFS from a vertex v with eccentricity e bounds each other vertex w by
+    max(d(v, w), e - d(v, w)) <= ecc(w) <= e + d(v, w) (Takes and Kosters).
+    Vertices whose bounds can no longer change the diameter or radius are
+    dropped, so usually far fewer than n BFS runs are needed.
+
+    Args:
+        indptr: CSR row pointers of a connected graph (see graph_to_csr)
+        indices: CSR neighbor indices
+        source: Index of the vertex the first BFS was run from
+        dist: Distances from that first BFS
+
+    Returns:
+        Tuple of (diameter, radius)
+    """
+    n = len(indptr) - 1
+
+    lower = np.zeros(n, dtype=np.int64)
+    upper = np.full(n, n, dtype=np.int64)
+    candidates = np.ones(n, dtype=bool)
+    diameter, radius = 0, n
+    pick_upper = True
+
+    while True:
+        eccentricity = int(dist.max())
+        lower = np.maximum(lower, np.maximum(dist, eccentricity - dist))
+        upper = np.minimum(upper, eccentricity + dist)
+
+        diameter = max(diameter, int(lower.max()))
+        radius = min(radius, int(upper.min()))
+        candidates &= (upper > diameter) | (lower < radius)
+        candidates[source] = False
+        if not candidates.any():
+            return diameter, radius
+
+        # Alternate between the most promising vertex for the diameter and for the radius
+        remaining = np.flatnonzero(candidates)
+        if pick_upper:
+            source = remaining[np.argmax(upper[remaining])]
+        else:
+            source = remaining[np.argmin(lower[remaining])]
+        pick_upper = not pick_upper
+
+        dist = _bfs_distances(indptr, indices, source)
+
+
+def compute_graph_statistics_batch(
+    graphs: Sequence[nx.Graph],
+    n_jobs: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Compute statistics for many graphs, one worker process per core.
+
+    Graphs are pickled to the workers, so they must not carry unpicklable
+    attributes.
+
+    Args:
+        graphs: Graphs to compute statistics for
+        n_jobs: Number of worker processes (None for all cores, 1 to run serially)
+
+    Returns:
+        List of statistics dictionaries, in the order of graphs
+    """
+    return _map_in_processes(compute_graph_statistics, graphs, n_jobs)
+
+
 def are_isomorphic(G1: nx.Graph, G2: nx.Graph) -> bool:
     """
     Check if two graphs are isomorphic using NetworkX.
@@ -269,29 +476,120 @@ def are_isomorphic(G1: nx.Graph, G2: nx.Graph) -> bool:
     Returns:
         True if graphs are isomorphic
     """
+    # Cheap invariants first; most non-isomorphic pairs never reach VF2
+    if G1.number_of_edges() != G2.number_of_edges():
+        return False
+    # Order and sorted degree sequence
+    if not nx.faster_could_be_isomorphic(G1, G2):
+        return False
+    # Sorted (degree, triangle count) pairs; triangles need simple undirected graphs
+    if _is_simple_undirected(G1) and _is_simple_undirected(G2):
+        if G1.number_of_nodes() <= TRIANGLE_BITSET_MAX_VERTICES:
+            if _degree_triangle_profile(G1) != _degree_triangle_profile(G2):
+                return False
+        elif not nx.fast_could_be_isomorphic(G1, G2):
+            return False
+
     return nx.is_isomorphic(G1, G2)
 
 
-def relabel_graph(graph: nx.Graph, seed: Optional[int] = None) -> nx.Graph:
+def _is_simple_undirected(graph: nx.Graph) -> bool:
+    return not graph.is_directed() and not graph.is_multigraph()
+
+
+def _degree_triangle_profile(graph: nx.Graph) -> List[Tuple[int, int]]:
+    """
+    Sorted (degree, triangle count) pairs, the invariant of nx.fast_could_be_isomorphic.
+
+    Triangles through u are half the common neighbors summed over u's edges;
+    each edge's count is a popcount over bit-packed adjacency rows instead of
+    a Python set intersection. Self-loops are ignored, as in nx.triangles.
+    """
+    indptr, indices, nodes = _graph_csr(graph)
+    n = len(nodes)
+    owners = np.repeat(np.arange(n), np.diff(indptr))
+    proper = owners != indices
+    sources, targets = owners[proper], indices[proper]
+
+    adjacency = np.zeros((n, n), dtype=bool)
+    adjacency[sources, targets] = True
+    rows = _packed_rows(adjacency)
+
+    # Chunk the edges so the temporary row pairs stay a few MB
+    per_edge = np.empty(sources.size, dtype=np.int64)
+    step = max(1, (1 << 20) // max(rows.shape[1], 1))
+    for start in range(0, sources.size, step):
+        chunk = slice(start, start + step)
+        per_edge[chunk] = np.bitwise_count(rows[sources[chunk]] & rows[targets[chunk]]).sum(axis=1)
+    triangles = np.bincount(sources, weights=per_edge, minlength=n).astype(np.int64) // 2
+
+    degrees = [d for _, d in graph.degree()]
+    return sorted(zip(degrees, triangles.tolist()))
+
+
+def are_isomorphic_batch(
+    pairs: Sequence[Tuple[nx.Graph, nx.Graph]],
+    n_jobs: Optional[int] = None
+) -> List[bool]:
+    """
+    Check many graph pairs for isomorphism, one worker process per core.
+
+    Graphs are pickled to the workers, so they must not carry unpicklable
+    attributes.
+
+    Args:
+        pairs: Sequence of (G1, G2) pairs
+        n_jobs: Number of worker processes (None for all cores, 1 to run serially)
+
+    Returns:
+        List of isomorphism results, in the order of pairs
+    """
+    return _map_in_processes(_are_isomorphic_pair, pairs, n_jobs)
+
+
+def _are_isomorphic_pair(pair: Tuple[nx.Graph, nx.Graph]) -> bool:
+    return are_isomorphic(*pair)
+
+
+def _map_in_processes(func: Callable[[Any], Any], items: Sequence[Any], n_jobs: Optional[int]) -> List[Any]:
+    """
+    Apply a module-level function to independent items in worker processes.
+
+    Threads would not help here: the work is pure Python and holds the GIL.
+    """
+    if n_jobs == 1 or len(items) < 2:
+        return [func(item) for item in items]
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        return list(pool.map(func, items))
+
+
+def relabel_graph(
+    graph: nx.Graph,
+    seed: Optional[Union[int, np.random.Generator]] = None
+) -> nx.Graph:
     """
     Randomly relabel vertices of a graph.
 
+    Only the structure is copied; node and edge attributes are dropped.
+
     Args:
         graph: Original graph
-        seed: Random seed for reproducibility
+        seed: Random seed, or a NumPy Generator to draw from (it is advanced,
+            so one Generator can drive a whole sequence of relabelings)
 
     Returns:
         Graph with relabeled vertices
     """
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     nodes = list(graph.nodes())
-    shuffled = nodes.copy()
-    random.shuffle(shuffled)
+    shuffled = [nodes[i] for i in rng.permutation(len(nodes))]
 
     mapping = dict(zip(nodes, shuffled))
-    return nx.relabel_nodes(graph, mapping)
+    relabeled = graph.__class__()
+    relabeled.add_nodes_from(shuffled)
+    relabeled.add_edges_from((mapping[u], mapping[v]) for u, v in graph.edges())
+    return relabeled
 
 
 def get_degree_sequence(graph: nx.Graph) -> List[int]:
@@ -332,30 +630,108 @@ def verify_strongly_regular_parameters(
     if v is not None and n != v:
         return False
 
-    # Check regularity
-    degrees = [d for _, d in graph.degree()]
-    if len(set(degrees)) != 1:
+    # Check regularity, stopping at the first vertex whose degree differs
+    degrees = (d for _, d in graph.degree())
+    degree = next(degrees, None)
+    if degree is None or any(d != degree for d in degrees):
         return False
 
-    degree = degrees[0]
     if k is not None and degree != k:
         return False
 
-    # Check lambda and mu parameters
-    for u in graph.nodes():
-        for v in graph.nodes():
-            if u == v:
-                continue
+    if l is None and m is None:
+        return True
+
+    # Common neighbors of u and v are popcount(rows[u] & rows[v]); check one row
+    # at a time and stop at the first row that breaks lambda or mu
+    rows = _graph_packed_rows(graph)
+    for u in range(n):
+        common = np.bitwise_count(rows[u] & rows).sum(axis=1)
+        adjacent = np.unpackbits(rows[u].view(np.uint8), count=n, bitorder="little").astype(bool)
+        non_adjacent = ~adjacent
+        adjacent[u] = non_adjacent[u] = False
+
+        # Adjacent vertices should have lambda common neighbors
+        if l is not None and not np.all(common[adjacent] == l):
+            return False
+        # Non-adjacent vertices should have mu common neighbors
+        if m is not None and not np.all(common[non_adjacent] == m):
+            return False
 
-            common_neighbors = len(set(graph.neighbors(u)) & set(graph.neighbors(v)))
+    return True
 
-            if graph.has_edge(u, v):
-                # Adjacent vertices should have lambda common neighbors
-                if l is not None and common_neighbors != l:
-                    return False
-            else:
-                # Non-adjacent vertices should have mu common neighbors
-                if m is not None and common_neighbors != m:
-                    return False
 
-    return True
+def verify_strongly_regular_parameters_batch(
+    graphs: Sequence[nx.Graph],
+    v: Optional[int] = None,
+    k: Optional[int] = None,
+    l: Optional[int] = None,
+    m: Optional[int] = None,
+    n_jobs: Optional[int] = None
+) -> List[bool]:
+    """
+    Verify many graphs against the same strongly regular parameters, one worker process per core.
+
+    Graphs are pickled to the workers, so they must not carry unpicklable
+    attributes.
+
+    Args:
+        graphs: Graphs to verify
+        v: Expected number of vertices (None to skip check)
+        k: Expected degree (None to skip check)
+        l: Expected lambda parameter (None to skip check)
+        m: Expected mu parameter (None to skip check)
+        n_jobs: Number of worker processes (None for all cores, 1 to run serially)
+
+    Returns:
+        List of verification results, in the order of graphs
+    """
+    verify = functools.partial(verify_strongly_regular_parameters, v=v, k=k, l=l, m=m)
+    return _map_in_processes(verify, graphs, n_jobs)
+
+
+def _graph_csr(graph: nx.Graph) -> Tuple[np.ndarray, np.ndarray, List[Any]]:
+    """
+    Return graph_to_csr(graph), memoized on the graph itself.
+
+    NetworkX clears ``graph.__networkx_cache__`` whenever the graph is mutated
+    through its API, so the cached arrays never go stale. Views are not
+    memoized on: they read their base graph's data, but mutating the base
+    graph clears only its own cache, and every view is frozen. Callers must
+    treat the arrays as read-only.
+    """
+    cache = None if nx.is_frozen(graph) else getattr(graph, "__networkx_cache__", None)
+    if cache is None:
+        return graph_to_csr(graph)
+    csr = cast(Optional[Tuple[np.ndarray, np.ndarray, List[Any]]], cache.get(_CSR_CACHE_KEY))
+    if csr is None:
+        csr = cache[_CSR_CACHE_KEY] = graph_to_csr(graph)
+    return csr
+
+
+def _graph_packed_rows(graph: nx.Graph) -> np.ndarray:
+    """
+    Bit-packed adjacency rows of graph (see _packed_rows), memoized like _graph_csr.
+
+    Only the packed rows are kept on the graph, n^2 / 8 bytes, not a full
+    boolean matrix or common-neighbor counts.
+    """
+    cache = None if nx.is_frozen(graph) else getattr(graph, "__networkx_cache__", None)
+    if cache is not None and _PACKED_ROWS_CACHE_KEY in cache:
+        return cast(np.ndarray, cache[_PACKED_ROWS_CACHE_KEY])
+
+    indptr, indices, nodes = _graph_csr(graph)
+    n = len(nodes)
+    adjacency = np.zeros((n, n), dtype=bool)
+    adjacency[np.repeat(np.arange(n), np.diff(indptr)), indices] = True
+    rows = _packed_rows(adjacency)
+
+    if cache is not None:
+        cache[_PACKED_ROWS_CACHE_KEY] = rows
+    return rows
+
+
+def _packed_rows(adjacency: np.ndarray) -> np.ndarray:
+    """Pack the rows of a boolean matrix into uint64 words (bit j of row u is adjacency[u, j])."""
+    rows = np.packbits(adjacency, axis=1, bitorder="little")
+    return np.pad(rows, ((0, 0), (0, -rows.shape[1] % 8))).view(np.uint64)
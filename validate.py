@@ -21,6 +21,7 @@ import numpy as np
 sys.path.insert(0, 'src')
 
 from gossip import GossipFingerprint, graph_to_adjacency_list
+from gossip import algorithm
 from gossip.utils import (
     generate_random_regular_graph,
     generate_cfi_pair,
@@ -31,6 +32,11 @@ from gossip.utils import (
 )
 
 
+def all_fingerprints_equal(fp: Tuple) -> bool:
+    """Check that every vertex has the same fingerprint, stopping at the first difference."""
+    return bool(fp) and all(f == fp[0] for f in fp)
+
+
 class ValidationSuite:
     """Comprehensive validation suite for the gossip algorithm."""
 
@@ -93,15 +99,13 @@ class ValidationSuite:
         G_cycle = nx.cycle_graph(6)
         adj = graph_to_adjacency_list(G_cycle)
         fp = self.gf.compute(adj)
-        unique_fps = len(set(fp))
-        self.test("Cycle graph symmetry", unique_fps == 1)
+        self.test("Cycle graph symmetry", all_fingerprints_equal(fp))
 
         # Complete graph
         G_complete = nx.complete_graph(5)
         adj = graph_to_adjacency_list(G_complete)
         fp = self.gf.compute(adj)
-        unique_fps = len(set(fp))
-        self.test("Complete graph symmetry", unique_fps == 1)
+        self.test("Complete graph symmetry", all_fingerprints_equal(fp))
 
         # Star graph
         G_star = nx.star_graph(4)
@@ -162,6 +166,20 @@ class ValidationSuite:
             f"Gossip: {gossip_match}, NetworkX: {nx_iso}"
         )
 
+        # Subgraph view whose base graph changes between comparisons
+        G_base = nx.path_graph(6)
+        V = G_base.subgraph(range(5))
+        self.gf.compare(V, nx.path_graph(5))
+        G_base.add_edge(0, 4)
+
+        gossip_match = self.gf.compare(V, nx.cycle_graph(5))
+        nx_iso = are_isomorphic(V, nx.cycle_graph(5))
+        self.test(
+            "Subgraph view after base mutation",
+            gossip_match == nx_iso == True,
+            f"Gossip: {gossip_match}, NetworkX: {nx_iso}"
+        )
+
     def run_hard_instance_tests(self):
         """Test hard instances."""
         self.log("\n=== Hard Instance Tests ===")
@@ -308,8 +326,23 @@ class ValidationSuite:
         H3 = nx.hypercube_graph(3)
         adj = graph_to_adjacency_list(H3)
         fp = self.gf.compute(adj)
-        unique_fps = len(set(fp))
-        self.test("Hypercube symmetry", unique_fps == 1)
+        self.test("Hypercube symmetry", all_fingerprints_equal(fp))
+
+        # Dense graph: the boolean-matrix kernel must match the list kernel
+        G_dense = nx.gnp_random_graph(80, 0.5, seed=7)
+        G_dense.add_edge(0, 0)
+        dense_fps = self.gf.compute_raw_fingerprints(G_dense)
+        max_vertices = algorithm.DENSE_MAX_VERTICES
+        algorithm.DENSE_MAX_VERTICES = 0  # force the list kernel
+        try:
+            list_fps = self.gf.compute_raw_fingerprints(G_dense)
+        finally:
+            algorithm.DENSE_MAX_VERTICES = max_vertices
+        self.test(
+            "Dense kernel matches list kernel",
+            G_dense.number_of_edges() >= algorithm.DENSE_MIN_EDGES and dense_fps == list_fps,
+            f"Edges: {G_dense.number_of_edges()}"
+        )
 
     def run_all(self):
         """Run all validation tests."""